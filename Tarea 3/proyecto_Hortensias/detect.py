@@ -1,158 +1,182 @@
-from ultralytics import YOLO
-import cv2
-from norfair import Detection, Tracker
-from tkinter import Tk
-from tkinter.filedialog import askopenfilename
 import os
-import numpy as np
+import sys
+
+# Las librerías pesadas (cv2, numpy, ultralytics, norfair y tkinter) se
+# importan dentro de las funciones que las usan: si no hay video que procesar
+# el programa termina sin pagar el costo de cargarlas.
 
 
 # 1. Selecciono el video 
 
-root = Tk()
-root.withdraw()
-root.attributes('-topmost', True)
+def seleccionar_video():
+    # Si la ruta llega por línea de comandos no se abre la ventana de Tk
+    if len(sys.argv) > 1:
+        return sys.argv[1]
+
+    from tkinter import Tk
+    from tkinter.filedialog import askopenfilename
+
+    root = Tk()
+    root.withdraw()
+    root.attributes('-topmost', True)
 
-video_path = askopenfilename(
-    title="Selecciona el archivo de video",
-    filetypes=(
-        ("Archivos de Video", "*.mp4 *.avi *.mov *.mkv"),
-        ("Todos los archivos", "*.*")
+    video_path = askopenfilename(
+        title="Selecciona el archivo de video",
+        filetypes=(
+            ("Archivos de Video", "*.mp4 *.avi *.mov *.mkv"),
+            ("Todos los archivos", "*.*")
+        )
     )
-)
+    root.destroy()
+    return video_path
+
+
+def main():
+    video_path = seleccionar_video()
 
-if not video_path:
-    print("No seleccionaste ningún video. Saliendo...")
-    exit()
+    if not video_path:
+        print("No seleccionaste ningún video. Saliendo...")
+        sys.exit()
 
-# 2. Preparo el nombre de salida del video
+    # 2. Preparo el nombre de salida del video
 
-folder = os.path.dirname(video_path)
-filename = os.path.basename(video_path)
-name_no_ext, ext = os.path.splitext(filename)
+    folder = os.path.dirname(video_path)
+    filename = os.path.basename(video_path)
+    name_no_ext, ext = os.path.splitext(filename)
 
-output_path = os.path.join(folder, f"{name_no_ext}_PROCESADO.mp4")
+    output_path = os.path.join(folder, f"{name_no_ext}_PROCESADO.mp4")
 
-# 3. Cargo modelo YOLO que es el encargado de detectar las hortensias en cada imagen
+    # 3. Abro el video antes de cargar el modelo, así un video inválido no
+    # paga la importación de ultralytics y norfair
 
-model = YOLO("best.pt")
+    import cv2
+    import numpy as np
 
-# 4. Inicializo el tracker de Norfair para darle seguimiento a cada hortensia 
+    cap = cv2.VideoCapture(video_path)
 
-tracker = Tracker(
-    distance_function="euclidean",
-    distance_threshold=30     # distancia máxima en píxeles
-)
+    if not cap.isOpened():
+        print(f"ERROR: No se pudo abrir el video: {video_path}")
+        sys.exit()
 
+    # 4. Cargo modelo YOLO que es el encargado de detectar las hortensias en cada imagen
+
+    from ultralytics import YOLO
+    from norfair import Detection, Tracker
+
+    model = YOLO("best.pt")
+
+    # 5. Inicializo el tracker de Norfair para darle seguimiento a cada hortensia 
+
+    tracker = Tracker(
+        distance_function="euclidean",
+        distance_threshold=30     # distancia máxima en píxeles
+    )
 
-# 5. Contadores de las hortensias blancas y cremosas
 
-detected_ids_blanca = set()
-detected_ids_cremosa = set()
-clases = ["hortensia_blanca", "hortensia_cremosa"]
+    # 6. Contadores de las hortensias blancas y cremosas
 
+    detected_ids_blanca = set()
+    detected_ids_cremosa = set()
+    clases = ["hortensia_blanca", "hortensia_cremosa"]
 
-# 6. Abro el video
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-cap = cv2.VideoCapture(video_path)
+    fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+    out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
 
-if not cap.isOpened():
-    print(f"ERROR: No se pudo abrir el video: {video_path}")
-    exit()
+    print(f"Guardando video procesado en:\n{output_path}")
 
-fps = cap.get(cv2.CAP_PROP_FPS)
-width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-out = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+    # 7. Procesamiento frame por frame
 
-print(f"Guardando video procesado en:\n{output_path}")
+    while True:
+        ret, frame = cap.read()
+        if not ret:
+            break
 
+        results = model(frame, verbose=False)
 
-# 7. Procesamiento frame por frame
+        detections_norfair = []
+        class_assignments = {}
 
-while True:
-    ret, frame = cap.read()
-    if not ret:
-        break
+        # Extraer cajas YOLO
+        for r in results:
+            for box in r.boxes:
+                x1, y1, x2, y2 = box.xyxy[0]
+                conf = float(box.conf[0])
+                cls = int(box.cls[0])
 
-    results = model(frame, verbose=False)
+                if conf < 0.4: # nivel de confianza
+                    continue
 
-    detections_norfair = []
-    class_assignments = {}
+                cx = float((x1 + x2) / 2)
+                cy = float((y1 + y2) / 2)
 
-    # Extraer cajas YOLO
-    for r in results:
-        for box in r.boxes:
-            x1, y1, x2, y2 = box.xyxy[0]
-            conf = float(box.conf[0])
-            cls = int(box.cls[0])
+                detections_norfair.append(
+                    Detection(points=np.array([cx, cy]))
+                )
+                class_assignments[(cx, cy)] = cls
 
-            if conf < 0.4: # nivel de confianza
-                continue
+        # Actualizar tracks
+        tracked_objects = tracker.update(detections_norfair)
 
-            cx = float((x1 + x2) / 2)
-            cy = float((y1 + y2) / 2)
+        # Dibujar
+        for track in tracked_objects:
+            cx, cy = track.estimate[0]
 
-            detections_norfair.append(
-                Detection(points=np.array([cx, cy]))
-            )
-            class_assignments[(cx, cy)] = cls
+            # Solo asignar clase si hay detecciones
+            if class_assignments:
+                closest_point = min(
+                    class_assignments.keys(),
+                    key=lambda p: (p[0] - cx)**2 + (p[1] - cy)**2
+                )
+                cls = class_assignments[closest_point]
 
-    # Actualizar tracks
-    tracked_objects = tracker.update(detections_norfair)
+                track_id = track.id
 
-    # Dibujar
-    for track in tracked_objects:
-        cx, cy = track.estimate[0]
+                if cls == 0:
+                    detected_ids_blanca.add(track_id)
+                    color = (255, 255, 255)
+                else:
+                    detected_ids_cremosa.add(track_id)
+                    color = (0, 255, 255)
 
-        # Solo asignar clase si hay detecciones
-        if class_assignments:
-            closest_point = min(
-                class_assignments.keys(),
-                key=lambda p: (p[0] - cx)**2 + (p[1] - cy)**2
-            )
-            cls = class_assignments[closest_point]
+                cv2.circle(frame, (int(cx), int(cy)), 6, color, -1)
+                cv2.putText(frame, f"{clases[cls]} ID:{track_id}",
+                            (int(cx) + 10, int(cy) - 10),
+                            cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
 
-            track_id = track.id
+        # Contadores
+        cv2.putText(frame, f"Blancas: {len(detected_ids_blanca)}",
+                    (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 3)
 
-            if cls == 0:
-                detected_ids_blanca.add(track_id)
-                color = (255, 255, 255)
-            else:
-                detected_ids_cremosa.add(track_id)
-                color = (0, 255, 255)
+        cv2.putText(frame, f"Cremosas: {len(detected_ids_cremosa)}",
+                    (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 3)
 
-            cv2.circle(frame, (int(cx), int(cy)), 6, color, -1)
-            cv2.putText(frame, f"{clases[cls]} ID:{track_id}",
-                        (int(cx) + 10, int(cy) - 10),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+        # Mostrar y guardar
+        cv2.imshow("Detección Hortensias", frame)
+        out.write(frame)
 
-    # Contadores
-    cv2.putText(frame, f"Blancas: {len(detected_ids_blanca)}",
-                (20, 40), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 3)
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            break
 
-    cv2.putText(frame, f"Cremosas: {len(detected_ids_cremosa)}",
-                (20, 80), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 255), 3)
 
-    # Mostrar y guardar
-    cv2.imshow("Detección Hortensias", frame)
-    out.write(frame)
 
-    if cv2.waitKey(1) & 0xFF == ord("q"):
-        break
+    # 8. Resultado final
 
+    print("===========================================")
+    print("RESULTADO FINAL (OBJETOS ÚNICOS DETECTADOS)")
+    print(f"Hortensias BLANCAS:  {len(detected_ids_blanca)}")
+    print(f"Hortensias CREMOSAS: {len(detected_ids_cremosa)}")
+    print("===========================================")
+    print(f"Video procesado guardado en:\n{output_path}")
 
-# 8. Resultado final
+    cap.release()
+    out.release()
+    cv2.destroyAllWindows()
 
-print("===========================================")
-print("RESULTADO FINAL (OBJETOS ÚNICOS DETECTADOS)")
-print(f"Hortensias BLANCAS:  {len(detected_ids_blanca)}")
-print(f"Hortensias CREMOSAS: {len(detected_ids_cremosa)}")
-print("===========================================")
-print(f"Video procesado guardado en:\n{output_path}")
 
-cap.release()
-out.release()
-cv2.destroyAllWindows()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Mide el tiempo de arranque de counting.py y detect.py con `python -X importtime`
+# para detectar regresiones: falla si alguno vuelve a importar una librería
+# pesada al inicio o si su importación supera el límite indicado.
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPTS = {
+    "counting": os.path.join(RAIZ, "Tarea 2"),
+    "detect": os.path.join(RAIZ, "Tarea 3", "proyecto_Hortensias"),
+}
+
+# Librerías que no deben cargarse solo por importar los scripts
+PESADAS = {
+    "cv2", "numpy", "matplotlib", "sklearn", "skimage",
+    "tkinter", "ultralytics", "norfair", "torch",
+}
+
+
+def medir(modulo, carpeta):
+    # Cada línea de -X importtime tiene el formato:
+    # import time: self [us] | cumulative | imported package
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=carpeta, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"ERROR: no se pudo importar {modulo}:\n{proc.stderr}")
+
+    total_us = 0
+    importados = set()
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith("import time:") or "self [us]" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        nombre = nombre.strip()
+        importados.add(nombre.split(".")[0])
+        if nombre == modulo:
+            total_us = int(acumulado)
+
+    return total_us, sorted(importados & PESADAS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tiempo de importación")
+    parser.add_argument("--limite-ms", type=float, default=50.0,
+                        help="tiempo máximo de importación por script (ms)")
+    args = parser.parse_args()
+
+    fallo = False
+    for modulo, carpeta in SCRIPTS.items():
+        total_us, pesadas = medir(modulo, carpeta)
+        print(f"{modulo}: {total_us / 1000:.1f} ms")
+
+        if pesadas:
+            print(f"  ERROR: importa al inicio: {', '.join(pesadas)}")
+            fallo = True
+        if total_us / 1000 > args.limite_ms:
+            print(f"  ERROR: supera el límite de {args.limite_ms} ms")
+            fallo = True
+
+    if fallo:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()